@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from struct import Struct
 from ..enums import (
     DAQAnalogMeasuremenType,
     DAQOhmsRange,
@@ -8,18 +9,51 @@ from ..enums import (
     DAQThermocoupleRange,
     DAQRTDRange,
 )
-from ...utils.encoding import make_int, make_float, ZERO_INT
 from ..base import ConfigError
-from .base import DAQAnalogChannel
+from .base import DAQAnalogChannel, COMMON_TRAILER_FORMAT
 from typing import override
 
-
-@dataclass(frozen=True, kw_only=True)
+_MT_OHMS = DAQAnalogMeasuremenType.Ohms.value
+_MT_VDC = DAQAnalogMeasuremenType.VDC.value
+_MT_VAC = DAQAnalogMeasuremenType.VAC.value
+_MT_FREQUENCY = DAQAnalogMeasuremenType.Frequency.value
+_MT_RTD = DAQAnalogMeasuremenType.RTD.value
+_MT_THERMOCOUPLE = DAQAnalogMeasuremenType.Thermocouple.value
+_MT_CURRENT = DAQAnalogMeasuremenType.Current.value
+
+_OHMS_STRUCT = Struct(">II8xI" + COMMON_TRAILER_FORMAT)
+_VDC_STRUCT = Struct(">II12x" + COMMON_TRAILER_FORMAT)
+_VAC_STRUCT = Struct(">II12x" + COMMON_TRAILER_FORMAT)
+_FREQUENCY_STRUCT = Struct(">I16x" + COMMON_TRAILER_FORMAT)
+_RTD_STRUCT = Struct(">IIffI" + COMMON_TRAILER_FORMAT)
+_THERMOCOUPLE_STRUCT = Struct(">II8xI" + COMMON_TRAILER_FORMAT)
+_CURRENT_STRUCT = Struct(">IIf4xI" + COMMON_TRAILER_FORMAT)
+
+# Extra bits keyed by four_wire
+_OHMS_EXTRA_BITS = {False: 0x9000, True: 0x9001}
+# Extra bits keyed by open_thermocouple_detect
+_THERMOCOUPLE_EXTRA_BITS = {False: 0x0000, True: 0x0001}
+_CURRENT_EXTRA_BITS = {
+    DAQCurrentRange.Current_20mA: 0x7000,
+    DAQCurrentRange.Current_100mA: 0x7001,
+}
+_CURRENT_MXAB_SCALE = {
+    DAQCurrentRange.Current_20mA: 6250.0,
+    DAQCurrentRange.Current_100mA: 1.0,
+}
+_CURRENT_MXAB_OFFSET = {
+    DAQCurrentRange.Current_20mA: 25.0,
+    DAQCurrentRange.Current_100mA: 0.0,
+}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogOhmsChannel(DAQAnalogChannel):
     range: DAQOhmsRange
     four_wire: bool = False
 
-    def __post_init__(self) -> None:
+    @override
+    def _validate(self) -> None:
         if (not self.four_wire) and (
             self.range == DAQOhmsRange.Ohms_300 or self.range == DAQOhmsRange.Ohms_3k
         ):
@@ -28,152 +62,126 @@ class DAQAnalogOhmsChannel(DAQAnalogChannel):
             )
 
     @override
-    def encode(self) -> bytes:
-        extra_bits = 0x9000
-        if self.four_wire:
-            extra_bits |= 0x0001
-
-        return (
-            make_int(DAQAnalogMeasuremenType.Ohms.value)
-            + make_int(self.range.value)
-            + ZERO_INT
-            + ZERO_INT
-            + make_int(extra_bits)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _OHMS_STRUCT.pack(
+            _MT_OHMS,
+            self.range.value,
+            _OHMS_EXTRA_BITS[self.four_wire],
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogVDCChannel(DAQAnalogChannel):
     range: DAQVDCRange
 
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQAnalogMeasuremenType.VDC.value)
-            + make_int(self.range.value)
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _VDC_STRUCT.pack(
+            _MT_VDC,
+            self.range.value,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogVACChannel(DAQAnalogChannel):
     range: DAQVACRange
 
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQAnalogMeasuremenType.VAC.value)
-            + make_int(self.range.value)
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _VAC_STRUCT.pack(
+            _MT_VAC,
+            self.range.value,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogFrequencyChannel(DAQAnalogChannel):
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQAnalogMeasuremenType.Frequency.value)
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _FREQUENCY_STRUCT.pack(
+            _MT_FREQUENCY,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogRTDChannel(DAQAnalogChannel):
     range: DAQRTDRange
     alpha: float = 0.0
     r0: float
 
-    def __post_init__(self) -> None:
+    @override
+    def _validate(self) -> None:
         if self.r0 < 10.0 or self.r0 > 1010.0:
             raise ConfigError("Custom RTD R0 value must be between 10 and 1010 Ohms")
 
-        if self.range == DAQRTDRange.RTD_FIXED_385:
-            if self.alpha != 0.0:
-                raise ConfigError("Fixed RTD does not allow for Alpha value to be set")
-        elif self.range == DAQRTDRange.RTD_CUSTOM_385:
-            if self.alpha < 0.00374 or self.alpha > 0.00393:
-                raise ConfigError(
-                    "Custom RTD Alpha value must be between 0.00374 and 0.00393"
-                )
+        match self.range:
+            case DAQRTDRange.RTD_FIXED_385:
+                if self.alpha != 0.0:
+                    raise ConfigError(
+                        "Fixed RTD does not allow for Alpha value to be set"
+                    )
+            case DAQRTDRange.RTD_CUSTOM_385:
+                if self.alpha < 0.00374 or self.alpha > 0.00393:
+                    raise ConfigError(
+                        "Custom RTD Alpha value must be between 0.00374 and 0.00393"
+                    )
 
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQAnalogMeasuremenType.RTD.value)
-            + make_int(self.range.value)
-            + make_float(self.alpha)
-            + make_float(self.r0)
-            + make_int(0x9001)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _RTD_STRUCT.pack(
+            _MT_RTD,
+            self.range.value,
+            self.alpha,
+            self.r0,
+            0x9001,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogThermocoupleChannel(DAQAnalogChannel):
     range: DAQThermocoupleRange
     open_thermocouple_detect: bool = True
 
     @override
-    def encode(self) -> bytes:
-        extra_bits = 0x0000
-        if self.open_thermocouple_detect:
-            extra_bits |= 0x0001
-
-        return (
-            make_int(DAQAnalogMeasuremenType.Thermocouple.value)
-            + make_int(self.range.value)
-            + ZERO_INT
-            + ZERO_INT
-            + make_int(extra_bits)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _THERMOCOUPLE_STRUCT.pack(
+            _MT_THERMOCOUPLE,
+            self.range.value,
+            _THERMOCOUPLE_EXTRA_BITS[self.open_thermocouple_detect],
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogCurrentChannel(DAQAnalogChannel):
     range: DAQCurrentRange
     shunt_resistance: float
 
-    def __post_init__(self) -> None:
+    @override
+    def _validate(self) -> None:
         if self.shunt_resistance < 10.0 or self.shunt_resistance > 250.0:
             raise ConfigError("Shunt resistance must be between 10 and 250 Ohms")
 
     @override
     def _modified_mxab_multiplier(self) -> float:
         modified_multiplier = self.mxab_multuplier * (1.0 / self.shunt_resistance)
-        if self.range == DAQCurrentRange.Current_20mA:
-            modified_multiplier *= 6250.0
-        return modified_multiplier
+        return modified_multiplier * _CURRENT_MXAB_SCALE[self.range]
 
     @override
     def _modified_mxab_offset(self) -> float:
-        if self.range == DAQCurrentRange.Current_20mA:
-            return self.mxab_offset - 25.0
-        return self.mxab_offset
+        return self.mxab_offset - _CURRENT_MXAB_OFFSET[self.range]
 
     @override
-    def encode(self) -> bytes:
-        extra_bits = 0x7000
-        if self.range == DAQCurrentRange.Current_100mA:
-            extra_bits |= 0x0001
-
-        return (
-            make_int(DAQAnalogMeasuremenType.Current.value)
-            + make_int(self.range.value)
-            + make_float(self.shunt_resistance)
-            + ZERO_INT
-            + make_int(extra_bits)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _CURRENT_STRUCT.pack(
+            _MT_CURRENT,
+            self.range.value,
+            self.shunt_resistance,
+            _CURRENT_EXTRA_BITS[self.range],
+            *self.common_trailer_fields(),
         )
@@ -1,10 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from struct import Struct
 from ..enums import DAQConfigAlarm
-from ...utils.encoding import make_int, make_float, make_optional_indexed_bit, ZERO_INT
+from ...utils.encoding import optional_indexed_bit
 from typing import override
 
+# alarm bits, alarm1 level, alarm2 level, alarm1 digital, alarm2 digital, mx+b multiplier, mx+b offset
+COMMON_TRAILER_FORMAT = "IffIIff"
 
-@dataclass(frozen=True, kw_only=True)
+type CommonTrailerFields = tuple[int, float, float, int, int, float, float]
+
+_DISABLED_STRUCT = Struct(">20x" + COMMON_TRAILER_FORMAT)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQChannel:
     use_channel_as_alarm_trigger: bool = True
     alarm1_mode: DAQConfigAlarm = DAQConfigAlarm.OFF
@@ -17,57 +25,76 @@ class DAQChannel:
     mxab_multuplier: float = 1.0
     mxab_offset: float = 0.0
 
-    def _modified_mxab_multiplier(self) -> float:
-        return self.mxab_multuplier
+    _common_trailer_fields: CommonTrailerFields = field(
+        init=False, repr=False, compare=False
+    )
+    _encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
-    def _modified_mxab_offset(self) -> float:
-        return self.mxab_offset
+    def __post_init__(self) -> None:
+        self._validate()
 
-    def encode_common_trailer(self) -> bytes:
         alarm_bits = 0x00
         if self.use_channel_as_alarm_trigger:
             alarm_bits |= 0x01
         alarm_bits |= self.alarm1_mode.value << 1
         alarm_bits |= self.alarm2_mode.value << 3
 
-        return (
-            make_int(alarm_bits)
-            + make_float(self.alarm1_level)
-            + make_float(self.alarm2_level)
-            + make_optional_indexed_bit(self.alarm1_digital)
-            + make_optional_indexed_bit(self.alarm2_digital)
-            + make_float(self._modified_mxab_multiplier())
-            + make_float(self._modified_mxab_offset())
+        trailer_fields: CommonTrailerFields = (
+            alarm_bits,
+            self.alarm1_level,
+            self.alarm2_level,
+            optional_indexed_bit(self.alarm1_digital),
+            optional_indexed_bit(self.alarm2_digital),
+            self._modified_mxab_multiplier(),
+            self._modified_mxab_offset(),
         )
+        object.__setattr__(self, "_common_trailer_fields", trailer_fields)
+
+    def _validate(self) -> None:
+        pass
+
+    def _modified_mxab_multiplier(self) -> float:
+        return self.mxab_multuplier
+
+    def _modified_mxab_offset(self) -> float:
+        return self.mxab_offset
+
+    def common_trailer_fields(self) -> CommonTrailerFields:
+        return self._common_trailer_fields
 
     def encode_with_aux(self, aux_offset: int) -> tuple[bytes, bytes]:
         return self.encode(), b""
 
+    def encode_into(self, out: bytearray, aux: bytearray) -> None:
+        payload, aux_payload = self.encode_with_aux(len(aux))
+        out += payload
+        aux += aux_payload
+
     def encode(self) -> bytes:
+        encoded = self._encoded
+        if encoded is None:
+            encoded = self._encode()
+            object.__setattr__(self, "_encoded", encoded)
+        return encoded
+
+    def _encode(self) -> bytes:
         raise NotImplementedError(
-            "write or write_with_aux method must be implemented in subclass"
+            "_encode or encode_with_aux method must be implemented in subclass"
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQDisabledChannel(DAQChannel):
     @override
-    def encode(self) -> bytes:
-        return (
-            ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + self.encode_common_trailer()
-        )
+    def _encode(self) -> bytes:
+        return _DISABLED_STRUCT.pack(*self.common_trailer_fields())
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQAnalogChannel(DAQChannel):
     pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQComputedChannel(DAQChannel):
     pass
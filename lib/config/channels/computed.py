@@ -1,74 +1,79 @@
-from .base import DAQComputedChannel
+from .base import DAQComputedChannel, COMMON_TRAILER_FORMAT
 from ..enums import DAQComputedMeasurementType
-from ...utils.encoding import make_int, ZERO_INT
 from ..equation import DAQEquation
 from dataclasses import dataclass
+from struct import Struct
 from typing import override
 
+_MT_AVERAGE = DAQComputedMeasurementType.Average.value
+_MT_AMINUSB = DAQComputedMeasurementType.AminusB.value
+_MT_EQUATION = DAQComputedMeasurementType.Equation.value
 
-@dataclass(frozen=True, kw_only=True)
+_AVERAGE_STRUCT = Struct(">I12xI" + COMMON_TRAILER_FORMAT)
+_AMINUSB_STRUCT = Struct(">I4xI4xI" + COMMON_TRAILER_FORMAT)
+_AMINUSAVG_STRUCT = Struct(">I4xI4xI" + COMMON_TRAILER_FORMAT)
+_EQUATION_STRUCT = Struct(">I12xI" + COMMON_TRAILER_FORMAT)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQComputedAverageChannel(DAQComputedChannel):
     channel_bitmask: int
 
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQComputedMeasurementType.Average.value)
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + make_int(self.channel_bitmask)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _AVERAGE_STRUCT.pack(
+            _MT_AVERAGE,
+            self.channel_bitmask,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQComputedAminusBChannel(DAQComputedChannel):
     channel_a: int
     channel_b: int
 
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQComputedMeasurementType.AminusB.value)
-            + ZERO_INT
-            + make_int(self.channel_a)
-            + ZERO_INT
-            + make_int(self.channel_b)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _AMINUSB_STRUCT.pack(
+            _MT_AMINUSB,
+            self.channel_a,
+            self.channel_b,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQComputedAminusAvgChannel(DAQComputedChannel):
     channel_a: int
     channel_bitmask: int
 
     @override
-    def encode(self) -> bytes:
-        return (
-            make_int(DAQComputedMeasurementType.AminusB.value)
-            + ZERO_INT
-            + make_int(self.channel_a)
-            + ZERO_INT
-            + make_int(self.channel_bitmask)
-            + self.encode_common_trailer()
+    def _encode(self) -> bytes:
+        return _AMINUSAVG_STRUCT.pack(
+            _MT_AMINUSB,
+            self.channel_a,
+            self.channel_bitmask,
+            *self.common_trailer_fields(),
         )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQComputedEquationChannel(DAQComputedChannel):
     equation: DAQEquation
 
+    def _encode_payload(self, aux_offset: int) -> bytes:
+        return _EQUATION_STRUCT.pack(
+            _MT_EQUATION,
+            aux_offset,
+            *self.common_trailer_fields(),
+        )
+
     @override
     def encode_with_aux(self, aux_offset: int) -> tuple[bytes, bytes]:
-        payload = (
-            make_int(DAQComputedMeasurementType.Equation.value)
-            + ZERO_INT
-            + ZERO_INT
-            + ZERO_INT
-            + make_int(aux_offset)
-            + self.encode_common_trailer()
-        )
+        return self._encode_payload(aux_offset), self.equation.encode()
 
-        return payload, self.equation.encode()
+    @override
+    def encode_into(self, out: bytearray, aux: bytearray) -> None:
+        out += self._encode_payload(len(aux))
+        self.equation.encode_into(aux)
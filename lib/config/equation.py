@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import Any, cast, override
+from struct import Struct
+from typing import Any, override
 from .base import ConfigError
-from ..utils.encoding import make_int, make_float, make_double
 from dataclasses import dataclass
 
 
@@ -32,6 +32,35 @@ class DAQEquationOpcode(Enum):
     SQRT = DAQEquationOpcodeConfig(0x0F, [], [], 1, 1)
 
 
+def _operand_format(expected_type: type[int] | type[float], expected_length: int) -> str:
+    if expected_type == int:
+        if expected_length == 2:
+            return "H"
+        elif expected_length == 4:
+            return "I"
+        raise ValueError(f"Invalid length for int argument: {expected_length}")
+    if expected_length == 4:
+        return "f"
+    elif expected_length == 8:
+        return "d"
+    raise ValueError(f"Invalid length for float argument: {expected_length}")
+
+
+# Opcode byte followed by its big-endian arguments
+_OPCODE_STRUCTS = {
+    opcode: Struct(
+        ">B"
+        + "".join(
+            _operand_format(expected_type, expected_length)
+            for expected_type, expected_length in zip(
+                opcode.value.args, opcode.value.lengths
+            )
+        )
+    )
+    for opcode in DAQEquationOpcode
+}
+
+
 class DAQEquationOperation:
     _opcode: DAQEquationOpcode
     _params: list[Any]
@@ -57,22 +86,7 @@ class DAQEquationOperation:
         self._params = params
 
     def encode(self) -> bytes:
-        expected_types = self._opcode.value.args
-        expected_lengths = self._opcode.value.lengths
-
-        payload = bytes([self._opcode.value.code])
-        for expected_type, expected_length, arg in zip(expected_types, expected_lengths, self._params):
-            if expected_type == int:
-                payload += make_int(cast(int, arg), len=expected_length)
-            elif expected_type == float:
-                if expected_length == 4:
-                    payload += make_float(cast(float, arg))
-                elif expected_length == 8:
-                    payload += make_double(cast(float, arg))
-                else:
-                    raise ValueError(f"Invalid length for float argument: {expected_length}")
-
-        return payload
+        return _OPCODE_STRUCTS[self._opcode].pack(self._opcode.value.code, *self._params)
 
     def get_opcode(self) -> DAQEquationOpcode:
         return self._opcode
@@ -232,8 +246,11 @@ class DAQEquation:
         return self
 
     def encode(self) -> bytes:
+        out = bytearray()
+        self.encode_into(out)
+        return bytes(out)
+
+    def encode_into(self, out: bytearray) -> None:
         self.validate()
-        payload = b""
         for op in self._ops:
-            payload += op.encode()
-        return payload
+            out += op.encode()
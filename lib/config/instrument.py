@@ -1,28 +1,46 @@
 from dataclasses import dataclass, field
 from datetime import timedelta
+from functools import reduce
+from .base import ConfigError
 from .enums import DAQConfigSpeed, DAQConfigTrigger, DAQConfigBits
-from .channels.base import DAQComputedChannel, DAQAnalogChannel
+from .channels.base import DAQComputedChannel, DAQAnalogChannel, DAQDisabledChannel
+from ..utils.encoding import make_int, make_timedelta
 
+CHANNEL_PAYLOAD_LENGTH = 2492
 
-@dataclass(frozen=True, kw_only=True)
+# Shared padding channel, so its payload is only encoded once
+_DISABLED_CHANNEL = DAQDisabledChannel()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DAQConfiguration:
     speed: DAQConfigSpeed = DAQConfigSpeed.SLOW
     temperature_fahrenheit: bool = False
     trigger_out: bool = False
     drift_correction: bool = True
     totalizer_debounce: bool = True
-    triggers: list[DAQConfigTrigger] = field(
-        default_factory=lambda: [DAQConfigTrigger.INTERVAL]
-    )
+    triggers: tuple[DAQConfigTrigger, ...] = (DAQConfigTrigger.INTERVAL,)
 
     interval_time: timedelta = timedelta(seconds=1)
     alarm_time: timedelta = timedelta(seconds=1)
     unknown3_time: timedelta = timedelta(milliseconds=100)
 
-    analog_channels: list[DAQAnalogChannel | None] = field(default_factory=lambda: [])
-    computed_channels: list[DAQComputedChannel | None] = field(default_factory=lambda: [])
+    analog_channels: tuple[DAQAnalogChannel | None, ...] = ()
+    computed_channels: tuple[DAQComputedChannel | None, ...] = ()
+
+    _bits: int = field(init=False, repr=False, compare=False)
+    # Encoded payloads keyed by (max analog channels, max computed channels)
+    _encoded: dict[tuple[int, int], tuple[bytes, bool]] = field(
+        default_factory=lambda: {}, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Copy channel and trigger sequences so the configuration (and its
+        # cached payload) cannot change after construction
+        object.__setattr__(self, "triggers", tuple(self.triggers))
+        object.__setattr__(self, "analog_channels", tuple(self.analog_channels))
+        object.__setattr__(self, "computed_channels", tuple(self.computed_channels))
 
-    def bits(self) -> int:
         result = self.speed.value
         if self.drift_correction or self.speed != DAQConfigSpeed.FAST:
             result |= DAQConfigBits.DRIFT_CORRECTION.value
@@ -32,6 +50,76 @@ class DAQConfiguration:
             result |= DAQConfigBits.FAHRENHEIT.value
         if self.totalizer_debounce:
             result |= DAQConfigBits.TOTALIZER_DEBOUNCE.value
-        for trig in self.triggers:
-            result |= trig.value
-        return result
+        result |= reduce(int.__or__, [trig.value for trig in self.triggers], 0)
+        object.__setattr__(self, "_bits", result)
+
+    def bits(self) -> int:
+        return self._bits
+
+    def encode(
+        self, max_analog_channels: int, max_computed_channels: int
+    ) -> tuple[bytes, bool]:
+        key = (max_analog_channels, max_computed_channels)
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            encoded = self._encode(max_analog_channels, max_computed_channels)
+            self._encoded[key] = encoded
+        return encoded
+
+    def _encode(
+        self, max_analog_channels: int, max_computed_channels: int
+    ) -> tuple[bytes, bool]:
+        payload = bytearray()
+        payload += make_int(self.bits())
+        payload += make_timedelta(self.interval_time)
+        payload += make_timedelta(self.alarm_time)
+        payload += make_timedelta(self.unknown3_time)
+
+        analog_channels = self.analog_channels
+        if len(analog_channels) < max_analog_channels:
+            analog_channels += (None,) * (
+                max_analog_channels - len(analog_channels)
+            )
+        elif len(analog_channels) > max_analog_channels:
+            raise ConfigError("Too many analog channels")
+        elif len(analog_channels) == 0:
+            raise ConfigError("No analog channels")
+
+        computed_channels = self.computed_channels
+        if len(computed_channels) < max_computed_channels:
+            computed_channels += (None,) * (
+                max_computed_channels - len(computed_channels)
+            )
+        elif len(computed_channels) > max_computed_channels:
+            raise ConfigError("Too many computed channels")
+
+        has_none_channel_prefixes = False
+
+        had_none_channels = False
+        aux_buffer = bytearray()
+        for chan in analog_channels:
+            if chan is None:
+                chan = _DISABLED_CHANNEL
+                had_none_channels = True
+            elif had_none_channels:
+                has_none_channel_prefixes = True
+            chan.encode_into(payload, aux_buffer)
+
+        had_none_channels = False
+        for chan in computed_channels:
+            if chan is None:
+                chan = _DISABLED_CHANNEL
+                had_none_channels = True
+            elif had_none_channels:
+                has_none_channel_prefixes = True
+            chan.encode_into(payload, aux_buffer)
+
+        payload += aux_buffer
+
+        length_left = CHANNEL_PAYLOAD_LENGTH - len(payload)
+        if length_left < 0:
+            raise ConfigError("Payload too large (too many equations?)")
+        elif length_left > 0:
+            payload += b"\x00" * length_left
+
+        return bytes(payload), has_none_channel_prefixes
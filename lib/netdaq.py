@@ -12,10 +12,8 @@ from asyncio import (
 )
 import socket
 from traceback import print_exc
-from .config.base import ConfigError
 from .config.enums import DAQCommand
 from .config.instrument import DAQConfiguration
-from .config.channels.base import DAQDisabledChannel
 from .utils.encoding import (
     make_int,
     parse_float,
@@ -23,12 +21,10 @@ from .utils.encoding import (
     parse_short,
     make_time,
     parse_time,
-    make_timedelta,
     INT_LEN,
     ZERO_INT,
 )
 
-CHANNEL_PAYLOAD_LENGTH = 2492
 FIXED_HEADER = bytes([0x46, 0x45, 0x4C, 0x58])
 HEADER_LEN = 16
 
@@ -287,70 +283,10 @@ class NetDAQ:
         await self.wait_for_idle()
 
     async def set_config(self, config: DAQConfiguration) -> None:
-        payload = (
-            make_int(config.bits())
-            + make_timedelta(config.interval_time)
-            + make_timedelta(config.alarm_time)
-            + make_timedelta(config.unknown3_time)
+        payload, has_none_channel_prefixes = config.encode(
+            self.analog_channels(), self.computed_channels()
         )
 
-        max_analog_channels = self.analog_channels()
-        analog_channels = config.analog_channels
-        if len(analog_channels) < max_analog_channels:
-            analog_channels += [
-                None
-                for _ in range(max_analog_channels - len(analog_channels))
-            ]
-        elif len(analog_channels) > max_analog_channels:
-            raise ConfigError("Too many analog channels")
-        elif len(analog_channels) == 0:
-            raise ConfigError("No analog channels")
-
-        max_computed_channels = self.computed_channels()
-        computed_channels = config.computed_channels
-        if len(computed_channels) < max_computed_channels:
-            computed_channels += [
-                None
-                for _ in range(max_computed_channels - len(computed_channels))
-            ]
-        elif len(computed_channels) > max_computed_channels:
-            raise ConfigError("Too many computed channels")
-
-        disabled_channel = DAQDisabledChannel()
-
-        has_none_channel_prefixes = False
-
-        had_none_channels = False
-        aux_buffer = b""
-        for chan in analog_channels:
-            if chan is None:
-                chan = disabled_channel
-                had_none_channels = True
-            elif had_none_channels:
-                has_none_channel_prefixes = True
-            res, equation = chan.encode_with_aux(len(aux_buffer))
-            payload += res
-            aux_buffer += equation
-
-        had_none_channels = False
-        for chan in computed_channels:
-            if chan is None:
-                chan = disabled_channel
-                had_none_channels = True
-            elif had_none_channels:
-                has_none_channel_prefixes = True
-            res, equation = chan.encode_with_aux(len(aux_buffer))
-            payload += res
-            aux_buffer += equation
-
-        payload += aux_buffer
-
-        length_left = CHANNEL_PAYLOAD_LENGTH - len(payload)
-        if length_left < 0:
-            raise ConfigError("Payload too large (too many equations?)")
-        elif length_left > 0:
-            payload += b"\x00" * length_left
-
         try:
             _ = await self.send_rpc(DAQCommand.SET_CONFIG, payload=payload)
         except ResponseErrorCodeException as e:
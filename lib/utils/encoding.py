@@ -1,9 +1,12 @@
-from struct import pack, unpack
+from struct import Struct
 from datetime import datetime, timedelta
 
 INT_LEN = 4
 ZERO_INT = b"\x00" * INT_LEN
 
+_FLOAT_STRUCT = Struct(">f")
+_TIMEDELTA_STRUCT = Struct(">IIII")
+
 
 def parse_int(data: bytes, *, len: int = INT_LEN) -> int:
     return int.from_bytes(data[:len], "big")
@@ -14,19 +17,11 @@ def parse_short(data: bytes) -> int:
 
 
 def make_int(value: int, *, len: int = INT_LEN) -> bytes:
-    return int.to_bytes(value, len, "big")
+    return value.to_bytes(len, "big")
 
 
 def parse_float(data: bytes) -> float:
-    return unpack(">f", data[:4])[0]
-
-
-def make_float(value: float) -> bytes:
-    return pack(">f", value)
-
-
-def make_double(value: float)-> bytes:
-    return pack(">d", value)
+    return _FLOAT_STRUCT.unpack_from(data)[0]
 
 
 def parse_time(data: bytes) -> datetime:
@@ -72,14 +67,9 @@ def make_timedelta(time: timedelta) -> bytes:
     minutes = (total_seconds // 60) % 60
     hours = (total_seconds // 3600)
 
-    return (
-        make_int(hours) +
-        make_int(minutes) +
-        make_int(seconds) +
-        make_int(time.microseconds // 1000)
-    )
+    return _TIMEDELTA_STRUCT.pack(hours, minutes, seconds, time.microseconds // 1000)
 
-def make_optional_indexed_bit(bit: int | None) -> bytes:
+def optional_indexed_bit(bit: int | None) -> int:
     if bit is None:
-        return ZERO_INT
-    return make_int(1 << bit)
+        return 0
+    return 1 << bit
@@ -43,9 +43,9 @@ async def main():
 
         await instrument.set_config(
             DAQConfiguration(
-                triggers=[DAQConfigTrigger.INTERVAL],
+                triggers=(DAQConfigTrigger.INTERVAL,),
                 interval_time=timedelta(milliseconds=500),
-                analog_channels=[
+                analog_channels=(
                     # NOTE: Some instruments allow using "None" here to disable earlier channels.
                     #       Some, however, do not. In this case an error will be raised from the set_config call
                     DAQAnalogVDCChannel(
@@ -57,12 +57,12 @@ async def main():
                     DAQAnalogVDCChannel(
                         range=DAQVDCRange.VDC_AUTO,
                     ),
-                ],
-                computed_channels=[
+                ),
+                computed_channels=(
                     DAQComputedEquationChannel(
                         equation=eq,
-                    )
-                ],
+                    ),
+                ),
             )
         )
         print("Config set!")